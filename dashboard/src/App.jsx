@@ -3,6 +3,18 @@ import Header from './components/Header';
 import FeedPanel from './components/FeedPanel';
 import Panel from './components/Panel';
 import { useMockData } from './hooks/useMockData';
+import { formatDateTime } from './utils/format';
+
+const DAY_MS = 24 * 60 * 60 * 1000;
+
+// Static content is built once at module load; React skips diffing an
+// element that is the same object as on the previous render.
+const NOTES = (
+  <div className="text-sm text-white/70 space-y-2">
+    <p>This is mock data only.</p>
+    <p>New tweets are simulated every few seconds.</p>
+  </div>
+);
 
 function toLocalInputValue(date) {
   const pad = (n) => String(n).padStart(2, '0');
@@ -18,35 +30,55 @@ function clampDateRange(start, end) {
   const s = new Date(start);
   const e = new Date(end);
   if (Number.isNaN(s.getTime()) || Number.isNaN(e.getTime())) return null;
-  if (s > e) return { start: end, end: start };
-  return { start, end };
+  // Carry the parsed bounds so consumers don't each re-parse the inputs.
+  const startMs = s.getTime();
+  const endMs = e.getTime();
+  if (s > e) return { start: end, end: start, startMs: endMs, endMs: startMs };
+  return { start, end, startMs, endMs };
+}
+
+// Tweets arrive newest-first, so those created after `ms` form a prefix;
+// binary-search its length instead of scanning the whole feed.
+function countNewerThan(tweets, ms) {
+  let lo = 0;
+  let hi = tweets.length;
+  while (lo < hi) {
+    const mid = (lo + hi) >>> 1;
+    if (tweets[mid].createdAtMs > ms) lo = mid + 1;
+    else hi = mid;
+  }
+  return lo;
+}
+
+function defaultRangeLocal() {
+  const now = new Date();
+  return {
+    start: toLocalInputValue(new Date(now.getTime() - DAY_MS)),
+    end: toLocalInputValue(now),
+  };
 }
 
 function App() {
   const { tweets } = useMockData();
-  const now = new Date();
-  const defaultEnd = toLocalInputValue(now);
-  const defaultStart = toLocalInputValue(new Date(now.getTime() - 24 * 60 * 60 * 1000));
-  const [startLocal, setStartLocal] = useState(defaultStart);
-  const [endLocal, setEndLocal] = useState(defaultEnd);
+  // Defaults are only needed on mount; computing them lazily keeps every
+  // later render (one per incoming tweet) from re-deriving them.
+  const [defaultRange] = useState(defaultRangeLocal);
+  const [startLocal, setStartLocal] = useState(defaultRange.start);
+  const [endLocal, setEndLocal] = useState(defaultRange.end);
 
   const range = useMemo(() => clampDateRange(startLocal, endLocal), [startLocal, endLocal]);
 
   const filteredTweets = useMemo(() => {
     if (!range) return [];
-    const startMs = new Date(range.start).getTime();
-    const endMs = new Date(range.end).getTime();
-    return tweets.filter((t) => {
-      const ms = new Date(t.createdAt).getTime();
-      return ms >= startMs && ms <= endMs;
-    });
+    return tweets.slice(
+      countNewerThan(tweets, range.endMs),
+      countNewerThan(tweets, range.startMs - 1),
+    );
   }, [range, tweets]);
 
   const summary = useMemo(() => {
     if (!range) return { total: 0, dailyAverage: 0, days: 0 };
-    const startMs = new Date(range.start).getTime();
-    const endMs = new Date(range.end).getTime();
-    const days = Math.max((endMs - startMs) / (24 * 60 * 60 * 1000), 1 / 1440); // min 1 minute
+    const days = Math.max((range.endMs - range.startMs) / DAY_MS, 1 / 1440); // min 1 minute
     const total = filteredTweets.length;
     const dailyAverage = total / days;
     return { total, dailyAverage, days };
@@ -83,8 +115,8 @@ function App() {
               <div className="mt-3 text-sm text-white/70">Choose a valid start and end time.</div>
             ) : (
               <div className="mt-3 text-xs text-white/60">
-                Showing tweets from <span className="text-white/80">{new Date(range.start).toLocaleString()}</span> to{' '}
-                <span className="text-white/80">{new Date(range.end).toLocaleString()}</span>.
+                Showing tweets from <span className="text-white/80">{formatDateTime(range.startMs)}</span> to{' '}
+                <span className="text-white/80">{formatDateTime(range.endMs)}</span>.
               </div>
             )}
           </Panel>
@@ -112,10 +144,7 @@ function App() {
           </Panel>
 
           <Panel title="Notes">
-            <div className="text-sm text-white/70 space-y-2">
-              <p>This is mock data only.</p>
-              <p>New tweets are simulated every few seconds.</p>
-            </div>
+            {NOTES}
           </Panel>
         </div>
       </main>
@@ -24,9 +24,7 @@ const FeedPanel = ({ tweets }) => {
             <article key={tweet.id} className="border border-white/10 rounded-md p-3">
               <div className="flex items-center justify-between gap-4">
                 <div className="text-sm font-medium">@{tweet.username}</div>
-                <div className="text-xs text-white/60">
-                  {new Date(tweet.createdAt).toLocaleString()}
-                </div>
+                <div className="text-xs text-white/60">{tweet.createdAtLabel}</div>
               </div>
               <p className="mt-2 text-sm text-white/90 leading-relaxed">{tweet.text}</p>
               <div className="mt-2 text-xs text-white/60 flex gap-4">
@@ -1,15 +1,39 @@
-import React from 'react';
+import React, { memo, useEffect, useState } from 'react';
+import { formatDateTime } from '../utils/format';
 
 const Header = () => {
-  const now = new Date();
+  // The clock owns its own tick so it neither depends on nor triggers
+  // re-renders of the data panels. Keeping the formatted string as state
+  // lets React skip the render when a tick lands on the same second.
+  const [clock, setClock] = useState(() => formatDateTime(Date.now()));
+
+  useEffect(() => {
+    let clockTimer;
+    // Wake just after each second boundary instead of on a free-running
+    // interval, which drifts and can repeat or skip a displayed second.
+    const schedule = (nowMs) => {
+      clockTimer = setTimeout(tick, 1000 - (nowMs % 1000));
+    };
+    const tick = () => {
+      const nowMs = Date.now();
+      setClock(formatDateTime(nowMs));
+      schedule(nowMs);
+    };
+    schedule(Date.now());
+
+    return () => {
+      clearTimeout(clockTimer);
+    };
+  }, []);
+
   return (
     <header className="sticky top-0 z-50 border-b border-white/10 bg-black">
       <div className="px-6 h-14 flex items-center justify-between">
         <div className="text-base font-semibold tracking-tight">Tweet Monitor</div>
-        <div className="text-sm text-white/70">{now.toLocaleString()}</div>
+        <div className="text-sm text-white/70">{clock}</div>
       </div>
     </header>
   );
 };
 
-export default Header;
+export default memo(Header);
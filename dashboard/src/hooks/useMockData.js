@@ -1,4 +1,10 @@
 import { useState, useEffect } from 'react';
+import { formatDateTime } from '../utils/format';
+
+const SEED_COUNT = 40;
+const MAX_TWEETS = 50;
+const TWEET_INTERVAL_MS = 3000;
+const SEED_WINDOW_MS = 7 * 24 * 60 * 60 * 1000;
 
 const NAMES = ['elonmusk', 'NASA', 'spacex', 'tesla', 'research', 'news', 'dev', 'tech'];
 const MESSAGES = [
@@ -16,42 +22,64 @@ function randomInt(min, max) {
   return Math.floor(Math.random() * (max - min + 1)) + min;
 }
 
-function generateSeedTweets(count = 30) {
+// Values derived from createdAt never change, so compute them once here
+// rather than re-parsing the ISO string on every filter and render pass.
+function withDerivedFields(tweet) {
+  const created = new Date(tweet.createdAt);
+  return {
+    ...tweet,
+    createdAtMs: created.getTime(),
+    createdAtLabel: formatDateTime(created),
+  };
+}
+
+function generateSeedTweets(count = SEED_COUNT) {
   const now = Date.now();
   return Array.from({ length: count }, (_, i) => {
     // spread across the last 7 days
-    const offsetMs = randomInt(0, 7 * 24 * 60 * 60 * 1000);
+    const offsetMs = randomInt(0, SEED_WINDOW_MS);
     const createdAt = new Date(now - offsetMs).toISOString();
-    return {
+    return withDerivedFields({
       id: `seed_${now}_${i}`,
       username: NAMES[randomInt(0, NAMES.length - 1)],
       text: MESSAGES[randomInt(0, MESSAGES.length - 1)],
       createdAt,
       likes: randomInt(0, 500),
       retweets: randomInt(0, 250),
-    };
-  }).sort((a, b) => new Date(b.createdAt) - new Date(a.createdAt));
+    });
+  }).sort((a, b) => b.createdAtMs - a.createdAtMs);
+}
+
+// Insert while keeping the list newest-first, so consumers can rely on the
+// order instead of re-sorting. Fresh tweets belong at the head, so the scan
+// normally stops immediately.
+function insertTweet(tweets, tweet, limit) {
+  let i = 0;
+  while (i < tweets.length && tweets[i].createdAtMs > tweet.createdAtMs) {
+    i += 1;
+  }
+  return [...tweets.slice(0, i), tweet, ...tweets.slice(i)].slice(0, limit);
 }
 
 export const useMockData = () => {
-  const [tweets, setTweets] = useState(() => generateSeedTweets(40));
+  const [tweets, setTweets] = useState(() => generateSeedTweets());
 
   useEffect(() => {
     // Simulate incoming tweets
     const tweetInterval = setInterval(() => {
       if (Math.random() > 0.6) {
-        const newTweet = {
+        const newTweet = withDerivedFields({
           id: Date.now().toString(),
           username: NAMES[Math.floor(Math.random() * NAMES.length)],
           text: MESSAGES[Math.floor(Math.random() * MESSAGES.length)],
           createdAt: new Date().toISOString(),
           likes: Math.floor(Math.random() * 1000),
           retweets: Math.floor(Math.random() * 500)
-        };
+        });
 
-        setTweets(prev => [newTweet, ...prev].slice(0, 50));
+        setTweets(prev => insertTweet(prev, newTweet, MAX_TWEETS));
       }
-    }, 3000);
+    }, TWEET_INTERVAL_MS);
 
     return () => {
       clearInterval(tweetInterval);
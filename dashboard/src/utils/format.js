@@ -0,0 +1,15 @@
+// Date#toLocaleString() builds a new locale formatter on every call. Sharing
+// one instance with the same (default) options gives identical output
+// without that setup cost.
+const dateTimeFormat = new Intl.DateTimeFormat(undefined, {
+  year: 'numeric',
+  month: 'numeric',
+  day: 'numeric',
+  hour: 'numeric',
+  minute: 'numeric',
+  second: 'numeric',
+});
+
+export function formatDateTime(date) {
+  return dateTimeFormat.format(date);
+}